@@ -6,15 +6,21 @@ Expected YAML (see example below) defines:
   - version (e.g., "2025-04")
   - input_path (under data-in/)
   - fields_* options
-  - write_topojson / simplify_pct (optional)
+  - write_topojson / simplify_pct / simplify_tolerance (optional)
+  - topojson_quantization (optional, default 1e5; 0 leaves it to mapshaper)
+  - write_geojsonl (optional newline-delimited copy of the full output)
 
 Outputs under:
   data-out/states/minnesota/precincts/<version>/
     mn-precincts-full.geojson
     mn-precincts-web.geojson
+    mn-precincts-full.geojsonl (if write_geojsonl)
     metadata.json
 """
 
+import copy
+import functools
+import io
 import json
 import os
 from pathlib import Path
@@ -24,8 +30,8 @@ from typing import Any, cast
 
 from civic_lib_core import log_utils
 import geopandas as gpd
-from shapely.geometry import MultiPolygon, Polygon
-from shapely.validation import make_valid
+from pyogrio import write_dataframe
+import shapely
 import yaml
 
 from civic_data_boundaries_us_mn_precincts.utils.get_paths import (
@@ -33,6 +39,11 @@ from civic_data_boundaries_us_mn_precincts.utils.get_paths import (
     get_data_out_dir,
 )
 
+try:  # libyaml C parser when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 logger = log_utils.logger
 
 
@@ -55,7 +66,12 @@ def _find_cfg_path() -> Path:
       2) data-in/ upward
       3) this file's directory upward.
     """
-    env_override = os.getenv("CIVIC_MN_CFG")
+    return _locate_cfg_path(os.getenv("CIVIC_MN_CFG"))
+
+
+@functools.cache
+def _locate_cfg_path(env_override: str | None) -> Path:
+    """Resolve the config path once per process (keyed by the env override)."""
     if env_override:
         p = Path(env_override)
         if p.exists():
@@ -72,10 +88,17 @@ def _find_cfg_path() -> Path:
 
 
 def _load_build_cfg() -> dict[str, Any]:
-    """Load the top-level `build:` dict from data-config/us_mn_precincts.yaml."""
-    cfg_path = _find_cfg_path()
+    """Load the top-level `build:` dict from data-config/us_mn_precincts.yaml.
+
+    Returns a deep copy of the cached parse so callers may mutate it freely.
+    """
+    return copy.deepcopy(_parse_build_cfg(_find_cfg_path()))
+
+
+@functools.cache
+def _parse_build_cfg(cfg_path: Path) -> dict[str, Any]:
     with cfg_path.open("r", encoding="utf-8") as f:
-        cfg_any = yaml.safe_load(f) or {}
+        cfg_any = yaml.load(f, Loader=SafeLoader) or {}
     if not isinstance(cfg_any, dict):
         raise BuildError("Config YAML did not parse to a dict")
     build = cfg_any.get("build")
@@ -106,14 +129,11 @@ def _out_dir(version: str) -> Path:
 
 
 def _normalize_columns(df: gpd.GeoDataFrame, to_lower: bool, trim: bool) -> gpd.GeoDataFrame:
-    cols = []
-    for c in df.columns:
-        nc = c
-        if to_lower:
-            nc = nc.lower()
-        if trim:
-            nc = nc.strip()
-        cols.append(nc)
+    cols = df.columns
+    if to_lower:
+        cols = cols.str.lower()
+    if trim:
+        cols = cols.str.strip()
     df.columns = cols
     return df
 
@@ -140,11 +160,54 @@ def _keep_columns(df: gpd.GeoDataFrame, keep: list[str]) -> gpd.GeoDataFrame:
 
 def _add_constant_fields(df: gpd.GeoDataFrame, add_fields: dict[str, Any]) -> gpd.GeoDataFrame:
     """Assign constant fields and keep GeoDataFrame typing."""
-    if add_fields:
-        for k, v in add_fields.items():
-            df[k] = v
-    # Explicit cast to satisfy static type checker that df remains a GeoDataFrame.
-    return cast("gpd.GeoDataFrame", df)
+    if not add_fields:
+        return df
+    # Single assign installs all columns at once; cast keeps Pyright on GeoDataFrame.
+    return cast("gpd.GeoDataFrame", df.assign(**add_fields))
+
+
+# -------------------------
+# Web GeoJSON
+# -------------------------
+
+# Tolerance (degrees, ~100 m) used at simplify_pct=1, the most reduction.
+_MAX_WEB_TOLERANCE_DEG = 0.001
+
+
+def _web_tolerance(build_cfg: dict[str, Any]) -> float:
+    """Return the web simplify tolerance in degrees (0 = no simplify).
+
+    build.simplify_tolerance wins if set; otherwise build.simplify_pct
+    (mapshaper-style percent of vertices retained, clamped to 0..50) maps
+    1..50 linearly onto _MAX_WEB_TOLERANCE_DEG.._MAX_WEB_TOLERANCE_DEG / 50,
+    so lower percentages simplify more.
+    """
+    explicit = build_cfg.get("simplify_tolerance")
+    if explicit is not None:
+        return max(0.0, float(explicit))
+    pct = _clamped_pct(build_cfg.get("simplify_pct", 0))
+    if pct <= 0:
+        return 0.0
+    return _MAX_WEB_TOLERANCE_DEG * (51 - pct) / 50
+
+
+def _simplify_web(gdf: gpd.GeoDataFrame, tolerance: float) -> gpd.GeoDataFrame:
+    """Return a simplified copy of gdf for web use.
+
+    Uses coverage simplification so neighbouring precincts keep shared edges
+    (no gaps or overlaps are introduced).
+    """
+    if tolerance <= 0:
+        return gdf
+    # coverage_simplify rejects non-polygonal input; leave any such rows as-is
+    geoms = gdf.geometry.to_numpy().copy()
+    type_ids = shapely.get_type_id(geoms)
+    polygonal = (type_ids == shapely.GeometryType.POLYGON) | (
+        type_ids == shapely.GeometryType.MULTIPOLYGON
+    )
+    if polygonal.any():
+        geoms[polygonal] = shapely.coverage_simplify(geoms[polygonal], tolerance)
+    return cast("gpd.GeoDataFrame", gdf.set_geometry(geoms, crs=gdf.crs))
 
 
 # -------------------------
@@ -152,6 +215,20 @@ def _add_constant_fields(df: gpd.GeoDataFrame, add_fields: dict[str, Any]) -> gp
 # -------------------------
 
 
+# Coordinate grid size for TopoJSON output (mapshaper quantization=).
+_DEFAULT_TOPOJSON_QUANTIZATION = 100_000
+
+
+def _quantization(val: Any, default: int = _DEFAULT_TOPOJSON_QUANTIZATION) -> int:
+    """Parse build.topojson_quantization (accepts 1e5-style values); 0 omits it."""
+    if val is None:
+        return default
+    try:
+        return max(0, int(float(val)))
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
 def _which_mapshaper() -> Path | None:
     exe = shutil.which("mapshaper")
     if not exe:
@@ -169,43 +246,65 @@ def _clamped_pct(val: Any, lo: int = 0, hi: int = 50) -> int:
 
 
 def _repair_geometries(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
-    # Try make_valid on invalid rows only
+    # Try make_valid on invalid rows only. The "structure" method keeps polygonal
+    # output only (spikes and dangling edges are dropped, not kept as lines in a
+    # GeometryCollection), so later steps only ever see Polygon/MultiPolygon.
     invalid_mask = ~gdf.geometry.is_valid
     if invalid_mask.any():
-        gdf.loc[invalid_mask, "geometry"] = gdf.loc[invalid_mask, "geometry"].map(make_valid)
-
-    # Fallback: buffer(0) for any remaining invalids (handles self-intersections)
-    invalid_mask = ~gdf.geometry.is_valid
-    if invalid_mask.any():
-        gdf.loc[invalid_mask, "geometry"] = gdf.loc[invalid_mask, "geometry"].buffer(0)
+        gdf.loc[invalid_mask, "geometry"] = shapely.make_valid(
+            gdf.loc[invalid_mask, "geometry"].to_numpy(), method="structure", keep_collapsed=False
+        )
 
-    # Normalize to Polygon/MultiPolygon to avoid mixed types
-    def _to_multi(geom):
-        if geom is None or geom.is_empty:
-            return geom
-        if isinstance(geom, Polygon):
-            return MultiPolygon([geom])
-        return geom
+    # Drop anything make_valid could not repair
+    still_invalid = ~gdf.geometry.is_valid
+    if still_invalid.any():
+        logger.warning(f"Dropping {int(still_invalid.sum())} geometries still invalid after repair")
+        gdf = cast("gpd.GeoDataFrame", gdf[~still_invalid])
 
-    gdf["geometry"] = gdf.geometry.map(_to_multi)
+    # Normalize to MultiPolygon to avoid mixed types (vectorized over the geometry array)
+    geoms = gdf.geometry.to_numpy().copy()
+    empty = shapely.is_empty(geoms)
+    is_poly = (shapely.get_type_id(geoms) == shapely.GeometryType.POLYGON) & ~empty
+    if is_poly.any():
+        geoms[is_poly] = shapely.multipolygons(geoms[is_poly].reshape(-1, 1))
+        gdf = cast("gpd.GeoDataFrame", gdf.set_geometry(geoms, crs=gdf.crs))
 
     # Drop empties if any got nuked during repair (rare but possible)
-    return gdf[~gdf.geometry.is_empty]
+    return cast("gpd.GeoDataFrame", gdf[~empty])
 
 
 def _write_topojson(
-    mapshaper_exe: Path, web_geojson: Path, topo_path: Path, simplify_pct: int
+    mapshaper_exe: Path,
+    gdf: gpd.GeoDataFrame,
+    topo_path: Path,
+    simplify_pct: int,
+    quantization: int = _DEFAULT_TOPOJSON_QUANTIZATION,
 ) -> Path | None:
-    args = [str(mapshaper_exe), str(web_geojson)]
+    # Read GeoJSON from stdin so mapshaper does not re-parse a file from disk;
+    # name the layer after the output so the TopoJSON object key stays stable.
+    args = [str(mapshaper_exe), "-i", "-", f"name={topo_path.stem}"]
     pct = _clamped_pct(simplify_pct)
     if pct > 0:
         args += ["-simplify", f"{pct}%", "keep-shapes"]
-    args += ["-o", "format=topojson", str(topo_path)]
+    args += ["-o", "format=topojson"]
+    if quantization > 0:
+        args.append(f"quantization={quantization}")
+    args.append(str(topo_path))
+
+    # Serialize with OGR (handles datetime columns, runs in C) into memory
+    try:
+        buf = io.BytesIO()
+        write_dataframe(gdf, buf, driver="GeoJSON", layer=topo_path.stem)
+    except Exception as exc:
+        logger.warning(f"Could not serialize GeoJSON for mapshaper: {exc}")
+        return None
 
     # Safe: no shell, executable discovered via PATH, arguments are constructed (not user-supplied)
-    res = subprocess.run(args, capture_output=True, text=True)  # noqa: S603
+    res = subprocess.run(args, input=buf.getvalue(), capture_output=True)  # noqa: S603
     if res.returncode != 0:
-        logger.warning(f"mapshaper failed; stdout={res.stdout} stderr={res.stderr}")
+        stdout = res.stdout.decode("utf-8", errors="replace")
+        stderr = res.stderr.decode("utf-8", errors="replace")
+        logger.warning(f"mapshaper failed; stdout={stdout} stderr={stderr}")
         return None
 
     logger.info(f"Wrote TopoJSON: {topo_path}")
@@ -217,19 +316,27 @@ def _write_topojson(
 # -------------------------
 
 
-def _write_metadata(full_path: Path, web_name: str, topo_name: str | None, out_dir: Path) -> Path:
-    gdf = gpd.read_file(full_path)
-    minx, miny, maxx, maxy = [float(x) for x in gdf.total_bounds]
+def _write_metadata(
+    bounds: tuple[float, float, float, float],
+    nfeat: int,
+    full_name: str,
+    web_name: str,
+    topo_name: str | None,
+    out_dir: Path,
+    geojsonl_name: str | None = None,
+) -> Path:
+    minx, miny, maxx, maxy = bounds
     meta = {
         "id": "mn-precincts",
         "title": "Minnesota Precincts",
         "paths": {
-            "full_geojson": "mn-precincts-full.geojson",
+            "full_geojson": full_name,
+            "full_geojsonl": geojsonl_name,
             "web_geojson": web_name,
             "web_topojson": topo_name,
         },
         "stats": {
-            "features": int(len(gdf)),
+            "features": nfeat,
             "bbox": [round(minx, 6), round(miny, 6), round(maxx, 6), round(maxy, 6)],
         },
         "spatial": {"crs": "EPSG:4326", "geometry_type": "Polygon"},
@@ -268,7 +375,7 @@ def main(version: str | None = None) -> int:
         src_path = _input_path(build_cfg)
         out_dir = _out_dir(version)
 
-        gdf: gpd.GeoDataFrame = gpd.read_file(src_path)
+        gdf: gpd.GeoDataFrame = gpd.read_file(src_path, engine="pyogrio")
 
         gdf = _normalize_columns(
             gdf,
@@ -279,14 +386,25 @@ def main(version: str | None = None) -> int:
         gdf = _add_constant_fields(gdf, add_fields=build_cfg.get("add_fields") or {})
         gdf = _keep_columns(gdf, keep=build_cfg.get("fields_keep") or [])
         gdf = _repair_geometries(gdf)
+        minx, miny, maxx, maxy = [float(x) for x in gdf.total_bounds]
+        bounds = (minx, miny, maxx, maxy)
+        nfeat = int(len(gdf))
 
         full_path = out_dir / "mn-precincts-full.geojson"
-        gdf.to_file(full_path, driver="GeoJSON")
+        gdf.to_file(full_path, driver="GeoJSON", engine="pyogrio")
         logger.info(f"Wrote full: {full_path}")
 
+        geojsonl_name: str | None = None
+        if bool(build_cfg.get("write_geojsonl", False)):
+            geojsonl_path = out_dir / "mn-precincts-full.geojsonl"
+            gdf.to_file(geojsonl_path, driver="GeoJSONSeq", engine="pyogrio")
+            geojsonl_name = geojsonl_path.name
+            logger.info(f"Wrote full geojsonl: {geojsonl_path}")
+
         web_geojson_name = "mn-precincts-web.geojson"
         web_geojson_path = out_dir / web_geojson_name
-        shutil.copy2(full_path, web_geojson_path)
+        web_gdf = _simplify_web(gdf, _web_tolerance(build_cfg))
+        web_gdf.to_file(web_geojson_path, driver="GeoJSON", engine="pyogrio")
         logger.info(f"Wrote web geojson: {web_geojson_path}")
 
         topo_name: str | None = None
@@ -294,21 +412,26 @@ def main(version: str | None = None) -> int:
             exe = _which_mapshaper()
             if exe:
                 topo_path = out_dir / "mn-precincts-web.topojson"
+                # Let mapshaper simplify from the full geometry, not the simplified web copy
                 topo_out = _write_topojson(
                     exe,
-                    web_geojson_path,
+                    gdf,
                     topo_path,
                     simplify_pct=_clamped_pct(build_cfg.get("simplify_pct", 0)),
+                    quantization=_quantization(build_cfg.get("topojson_quantization")),
                 )
                 topo_name = topo_out.name if topo_out else None
             else:
                 logger.warning("mapshaper not found; skipping TopoJSON.")
 
         _write_metadata(
-            full_path=full_path,
+            bounds=bounds,
+            nfeat=nfeat,
+            full_name=full_path.name,
             web_name=web_geojson_name,
             topo_name=topo_name,
             out_dir=out_dir,
+            geojsonl_name=geojsonl_name,
         )
 
         logger.info("Build completed.")
@@ -8,12 +8,14 @@ CLI:
   uv run python -m civic_data_boundaries_us_mn_precincts.index
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 from civic_lib_core import date_utils, log_utils
-import geopandas as gpd
+from pyogrio import read_dataframe, read_info
 
 from civic_data_boundaries_us_mn_precincts.utils.get_paths import get_data_out_dir
 
@@ -26,23 +28,31 @@ class IndexBuildError(Exception):
     pass
 
 
-def _compute_bbox(geojson_path: Path) -> list[float] | None:
-    try:
-        gdf: gpd.GeoDataFrame = gpd.read_file(geojson_path)
-        minx, miny, maxx, maxy = [float(x) for x in gdf.total_bounds]
-        return [round(minx, 6), round(miny, 6), round(maxx, 6), round(maxy, 6)]
-    except Exception as e:
-        logger.warning(f"Could not read {geojson_path.name}: {e}")
-        return None
+def _stream_bbox_and_count(geojson_path: Path) -> tuple[tuple[float, ...], int]:
+    """Return bbox and row count from a geometry-only read (no attribute columns)."""
+    gdf = read_dataframe(geojson_path, columns=[])
+    return tuple(float(x) for x in gdf.total_bounds), int(len(gdf))
+
 
+def _scan_geojson(geojson_path: Path) -> tuple[list[float] | None, int | None]:
+    """Return (bbox, feature_count) for a GeoJSON from driver metadata.
 
-def _compute_feature_count(geojson_path: Path) -> int | None:
+    Uses pyogrio.read_info so geometries are never materialized. Falls back to a
+    geometry-only scan if the driver cannot report bounds or count (in practice
+    only for empty layers).
+    """
     try:
-        gdf: gpd.GeoDataFrame = gpd.read_file(geojson_path)
-        return int(len(gdf))
+        info = read_info(str(geojson_path), force_feature_count=True, force_total_bounds=True)
+        bounds = info.get("total_bounds")
+        nfeat = int(info.get("features", -1))
+        if bounds is None or nfeat < 0:
+            bounds, nfeat = _stream_bbox_and_count(geojson_path)
+        minx, miny, maxx, maxy = [float(x) for x in bounds]
+        bbox = [round(minx, 6), round(miny, 6), round(maxx, 6), round(maxy, 6)]
+        return bbox, nfeat
     except Exception as e:
-        logger.warning(f"Could not count features in {geojson_path.name}: {e}")
-        return None
+        logger.warning(f"Could not read {geojson_path.name}: {e}")
+        return None, None
 
 
 def _write_manifest(out_dir: Path, index_data: list[dict[str, Any]]) -> Path:
@@ -126,9 +136,12 @@ def build_index_main() -> int:
         flat_index: list[dict[str, Any]] = []
 
         logger.info(f"Scanning {out_root} for GeoJSONs...")
-        for geojson in out_root.rglob("*.geojson"):
-            bbox = _compute_bbox(geojson)
-            nfeat = _compute_feature_count(geojson)
+        geojsons = list(out_root.rglob("*.geojson"))
+        # pyogrio releases the GIL while OGR reads, so threads overlap file scans
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            results = list(ex.map(_scan_geojson, geojsons))
+
+        for geojson, (bbox, nfeat) in zip(geojsons, results, strict=True):
             flat_index.append(
                 {
                     "path": str(geojson.relative_to(out_root)),
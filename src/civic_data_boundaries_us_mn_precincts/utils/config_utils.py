@@ -4,17 +4,32 @@ This module provides utilities for loading and merging YAML configuration files
 for geographic data layers, including global defaults and layer-specific overrides.
 """
 
+import copy
+import functools
 from pathlib import Path
 from typing import Any
 
 from civic_lib_core import log_utils
 import yaml
 
+try:  # libyaml C parser when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 logger = log_utils.logger
 
 
 def load_layer_config(layer_name: str) -> dict[str, Any]:
-    """Load configuration for a given layer, merged with global defaults."""
+    """Load configuration for a given layer, merged with global defaults.
+
+    YAML files are parsed once per process; each call returns a fresh deep copy.
+    """
+    return copy.deepcopy(_load_layer_config_cached(layer_name))
+
+
+@functools.cache
+def _load_layer_config_cached(layer_name: str) -> dict[str, Any]:
     yaml_dir = Path(__file__).parent.parent.parent.parent / "data-config"
     logger.debug(f"Looking for YAML configs in {yaml_dir}")
 
@@ -22,13 +37,15 @@ def load_layer_config(layer_name: str) -> dict[str, Any]:
     if not yaml_files:
         logger.warning(f"No YAML config files found in {yaml_dir}")
         return {}
+    # Parse the file most likely to define this layer first, then the rest
+    yaml_files.sort(key=lambda f: (0 if layer_name in f.stem else 1, f.name))
     logger.debug(f"Found YAML config files: {[f.name for f in yaml_files]}")
 
     for yaml_file in yaml_files:
         with yaml_file.open(encoding="utf-8") as f:
             logger.debug(f"Loading config from {yaml_file.name}")
             # Load the YAML file
-            config: dict[str, Any] = yaml.safe_load(f) or {}
+            config: dict[str, Any] = yaml.load(f, Loader=SafeLoader) or {}
 
             # Check all layers in this file
             for layer in config.get("layers", []):
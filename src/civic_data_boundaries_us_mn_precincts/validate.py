@@ -16,6 +16,8 @@ from pathlib import Path
 
 from civic_lib_core import log_utils
 import geopandas as gpd
+from pyogrio import read_dataframe
+import shapely
 
 from civic_data_boundaries_us_mn_precincts.utils.get_paths import get_data_out_dir
 
@@ -54,16 +56,19 @@ def _require_files(folder: Path, names: Iterable[str]) -> None:
 
 
 def _load_gdf(geojson_path: Path) -> gpd.GeoDataFrame:
+    # One read: OGR's GeoJSON driver parses the whole document even for
+    # metadata-only calls, so a separate read_info pre-check only adds cost.
     try:
-        gdf = gpd.read_file(geojson_path)
+        gdf: gpd.GeoDataFrame = read_dataframe(geojson_path)
     except Exception as exc:
         raise ValidateError(f"Failed to read {geojson_path}: {exc}") from exc
     if gdf.empty:
         raise ValidateError(f"No features in {geojson_path}")
     if gdf.crs is None or str(gdf.crs).lower() not in ("epsg:4326", "wgs84"):
         raise ValidateError(f"CRS must be EPSG:4326. Found: {gdf.crs}")
-    if not gdf.geometry.is_valid.all():
-        invalid = (~gdf.geometry.is_valid).sum()
+    valid = shapely.is_valid(gdf.geometry.to_numpy())
+    if not valid.all():
+        invalid = int((~valid).sum())
         raise ValidateError(f"Found {invalid} invalid geometries in {geojson_path}")
     return gdf
 
@@ -77,9 +82,11 @@ def _require_columns(gdf: gpd.GeoDataFrame, cols: Iterable[str]) -> None:
 def _check_precinct_id_unique(gdf: gpd.GeoDataFrame, col: str = "precinct_id") -> None:
     if col not in gdf.columns:
         return
-    dups = gdf[col][gdf[col].duplicated()].unique()
-    if len(dups) > 0:
-        raise ValidateError(f"Duplicate {col} values: {list(dups)[:10]}...")
+    dup_mask = gdf[col].duplicated(keep=False)
+    if not dup_mask.any():
+        return
+    dups = gdf.loc[dup_mask, col].drop_duplicates().head(10).tolist()
+    raise ValidateError(f"Duplicate {col} values: {dups}...")
 
 
 def main(version: str) -> int:
@@ -0,0 +1,240 @@
+import json
+import os
+from pathlib import Path
+import sys
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+import shapely
+from shapely.geometry import MultiPolygon, Polygon
+
+from civic_data_boundaries_us_mn_precincts.build_layer import (
+    _DEFAULT_TOPOJSON_QUANTIZATION,
+    _MAX_WEB_TOLERANCE_DEG,
+    _quantization,
+    _repair_geometries,
+    _simplify_web,
+    _web_tolerance,
+    _which_mapshaper,
+    _write_topojson,
+)
+
+
+def _jagged_neighbours() -> gpd.GeoDataFrame:
+    # Two precincts sharing a wiggly vertical edge near x=1. Each zig-zag
+    # triangle is ~1e-7 deg^2, below tol^2 at simplify_pct=10 (~6.7e-7), so
+    # coverage_simplify's area-based (Visvalingam-Whyatt) pass removes them.
+    edge = [(1 + 0.000005 * (-1) ** i, i / 100) for i in range(101)]
+    left = Polygon([(0, 0), *edge, (0, 1)])
+    right = Polygon([*edge, (2, 1), (2, 0)])
+    return gpd.GeoDataFrame({"precinct_id": ["a", "b"]}, geometry=[left, right], crs="EPSG:4326")
+
+
+def test_web_tolerance_disabled_by_default():
+    assert _web_tolerance({}) == 0.0
+    assert _web_tolerance({"simplify_pct": 0}) == 0.0
+
+
+def test_web_tolerance_explicit_wins():
+    assert _web_tolerance({"simplify_tolerance": 0.0005, "simplify_pct": 10}) == 0.0005
+    assert _web_tolerance({"simplify_tolerance": -1}) == 0.0
+
+
+def test_web_tolerance_pct_mapping():
+    assert _web_tolerance({"simplify_pct": 1}) == pytest.approx(_MAX_WEB_TOLERANCE_DEG)
+    assert _web_tolerance({"simplify_pct": 50}) == pytest.approx(_MAX_WEB_TOLERANCE_DEG / 50)
+    # Clamped at 50
+    assert _web_tolerance({"simplify_pct": 90}) == _web_tolerance({"simplify_pct": 50})
+    assert _web_tolerance({"simplify_pct": 10}) > _web_tolerance({"simplify_pct": 40})
+
+
+def test_simplify_web_zero_tolerance_is_noop():
+    gdf = _jagged_neighbours()
+    assert _simplify_web(gdf, 0.0) is gdf
+
+
+def test_simplify_web_keeps_shared_edges():
+    gdf = _jagged_neighbours()
+    out = _simplify_web(gdf, _web_tolerance({"simplify_pct": 10}))
+
+    assert isinstance(out, gpd.GeoDataFrame)
+    assert out.crs == gdf.crs
+    assert list(out["precinct_id"]) == ["a", "b"]
+    assert shapely.get_num_coordinates(out.geometry.to_numpy()).sum() < (
+        shapely.get_num_coordinates(gdf.geometry.to_numpy()).sum()
+    )
+
+    left, right = out.geometry
+    assert left.intersection(right).area == pytest.approx(0.0, abs=1e-12)
+    union = left.union(right)
+    assert union.geom_type == "Polygon"
+    assert len(union.interiors) == 0
+
+
+def test_repair_geometries_normalizes_to_multipolygon_and_drops_empties():
+    square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    multi = MultiPolygon([Polygon([(2, 0), (3, 0), (3, 1), (2, 1)])])
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])  # self-intersecting
+    gdf = gpd.GeoDataFrame(
+        {"precinct_id": ["square", "multi", "empty", "bowtie"]},
+        geometry=[square, multi, Polygon(), bowtie],
+        crs="EPSG:4326",
+    )
+
+    out = _repair_geometries(gdf)
+
+    assert list(out["precinct_id"]) == ["square", "multi", "bowtie"]
+    assert (out.geometry.geom_type == "MultiPolygon").all()
+    assert not out.geometry.is_empty.any()
+    assert out.geometry.is_valid.all()
+    assert out.crs == gdf.crs
+
+
+@pytest.mark.parametrize(
+    ("val", "expected"),
+    [
+        (None, _DEFAULT_TOPOJSON_QUANTIZATION),
+        (100000, 100000),
+        (1e5, 100000),
+        ("1e5", 100000),
+        (2.5e4, 25000),
+        (0, 0),
+        (-10, 0),
+        ("not-a-number", _DEFAULT_TOPOJSON_QUANTIZATION),
+        ([1], _DEFAULT_TOPOJSON_QUANTIZATION),
+        ("inf", _DEFAULT_TOPOJSON_QUANTIZATION),
+    ],
+)
+def test_quantization(val, expected):
+    assert _quantization(val) == expected
+
+
+def _spiked_square() -> Polygon:
+    # Square with a dangling edge out to x=1.5; make_valid (linework) would
+    # return a GeometryCollection with a LineString
+    return Polygon([(0, 0), (1, 0), (1, 0.5), (1.5, 0.5), (1, 0.5), (1, 1), (0, 1)])
+
+
+def test_repair_geometries_drops_spikes_to_polygonal_output():
+    gdf = gpd.GeoDataFrame({"precinct_id": ["spike"]}, geometry=[_spiked_square()], crs="EPSG:4326")
+
+    out = _repair_geometries(gdf)
+
+    assert list(out.geometry.geom_type) == ["MultiPolygon"]
+    assert out.geometry.is_valid.all()
+    assert out.geometry.iloc[0].area == pytest.approx(1.0)
+
+
+def test_simplify_web_after_repair_with_spike():
+    gdf = gpd.GeoDataFrame(
+        {"precinct_id": ["spike", "neighbour"]},
+        geometry=[_spiked_square(), Polygon([(1, 0), (2, 0), (2, 1), (1, 1)])],
+        crs="EPSG:4326",
+    )
+
+    out = _simplify_web(_repair_geometries(gdf), 0.001)
+
+    assert list(out["precinct_id"]) == ["spike", "neighbour"]
+    assert out.geometry.is_valid.all()
+
+
+def test_simplify_web_leaves_non_polygonal_rows():
+    collection = shapely.GeometryCollection(
+        [Polygon([(3, 0), (4, 0), (4, 1), (3, 1)]), shapely.LineString([(4, 0.5), (5, 0.5)])]
+    )
+    gdf = _jagged_neighbours()
+    gdf = gpd.GeoDataFrame(
+        {"precinct_id": ["a", "b", "c"]},
+        geometry=[*gdf.geometry, collection],
+        crs="EPSG:4326",
+    )
+
+    out = _simplify_web(gdf, 0.001)
+
+    assert out.geometry.iloc[2].equals(collection)
+
+
+_STUB_MAPSHAPER = """#!{python}
+import json, os, sys
+from pathlib import Path
+
+out = Path(os.environ["STUB_OUT"])
+(out / "args.json").write_text(json.dumps(sys.argv[1:]))
+(out / "stdin.geojson").write_bytes(sys.stdin.buffer.read())
+print("stub stdout")
+print("stub stderr", file=sys.stderr)
+sys.exit(int(os.environ.get("STUB_EXIT", "0")))
+"""
+
+
+@pytest.fixture
+def stub_mapshaper(tmp_path: Path, monkeypatch) -> Path:
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    exe = bindir / "mapshaper"
+    exe.write_text(_STUB_MAPSHAPER.format(python=sys.executable))
+    exe.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bindir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("STUB_OUT", str(tmp_path))
+    return tmp_path
+
+
+def _frame_with_datetime() -> gpd.GeoDataFrame:
+    return gpd.GeoDataFrame(
+        {"precinct_id": ["a"], "eff_date": pd.to_datetime(["2025-04-10"])},
+        geometry=[MultiPolygon([Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])])],
+        crs="EPSG:4326",
+    )
+
+
+def test_write_topojson_pipes_geojson_to_mapshaper(stub_mapshaper):
+    exe = _which_mapshaper()
+    assert exe is not None
+    topo_path = stub_mapshaper / "mn-precincts-web.topojson"
+
+    out = _write_topojson(
+        exe, _frame_with_datetime(), topo_path, simplify_pct=10, quantization=_quantization(1e5)
+    )
+
+    assert out == topo_path
+    args = json.loads((stub_mapshaper / "args.json").read_text())
+    assert args == [
+        "-i",
+        "-",
+        "name=mn-precincts-web",
+        "-simplify",
+        "10%",
+        "keep-shapes",
+        "-o",
+        "format=topojson",
+        "quantization=100000",
+        str(topo_path),
+    ]
+    fc = json.loads((stub_mapshaper / "stdin.geojson").read_bytes())
+    assert fc["type"] == "FeatureCollection"
+    (feature,) = fc["features"]
+    assert feature["properties"]["precinct_id"] == "a"
+    assert feature["properties"]["eff_date"].startswith("2025-04-10")
+    assert feature["geometry"]["type"] == "MultiPolygon"
+
+
+def test_write_topojson_omits_optional_args(stub_mapshaper):
+    exe = _which_mapshaper()
+    assert exe is not None
+    topo_path = stub_mapshaper / "out.topojson"
+
+    _write_topojson(exe, _frame_with_datetime(), topo_path, simplify_pct=0, quantization=0)
+
+    args = json.loads((stub_mapshaper / "args.json").read_text())
+    assert args == ["-i", "-", "name=out", "-o", "format=topojson", str(topo_path)]
+
+
+def test_write_topojson_returns_none_on_failure(stub_mapshaper, monkeypatch):
+    monkeypatch.setenv("STUB_EXIT", "2")
+    exe = _which_mapshaper()
+    assert exe is not None
+
+    out = _write_topojson(exe, _frame_with_datetime(), stub_mapshaper / "x.topojson", 10)
+
+    assert out is None
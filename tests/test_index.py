@@ -0,0 +1,59 @@
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+from civic_data_boundaries_us_mn_precincts.index import _scan_geojson, _stream_bbox_and_count
+
+
+def _square(x0: float, y0: float, size: float = 1.0) -> list[list[list[float]]]:
+    return [[[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]]
+
+
+def _write_geojson(path: Path, polygons: list[list[list[list[float]]]]) -> Path:
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"precinct_id": str(i)},
+            "geometry": {"type": "Polygon", "coordinates": coords},
+        }
+        for i, coords in enumerate(polygons)
+    ]
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    return path
+
+
+@pytest.fixture
+def two_squares(tmp_path: Path) -> Path:
+    return _write_geojson(tmp_path / "two.geojson", [_square(-97.0, 44.0), _square(-92.0, 47.0)])
+
+
+@pytest.fixture
+def empty_geojson(tmp_path: Path) -> Path:
+    return _write_geojson(tmp_path / "empty.geojson", [])
+
+
+def test_stream_bbox_and_count_non_empty(two_squares):
+    bounds, nfeat = _stream_bbox_and_count(two_squares)
+    assert nfeat == 2
+    assert bounds == pytest.approx((-97.0, 44.0, -91.0, 48.0))
+
+
+def test_stream_bbox_and_count_empty(empty_geojson):
+    bounds, nfeat = _stream_bbox_and_count(empty_geojson)
+    assert nfeat == 0
+    assert all(math.isnan(v) for v in bounds)
+
+
+def test_scan_geojson_non_empty(two_squares):
+    bbox, nfeat = _scan_geojson(two_squares)
+    assert nfeat == 2
+    assert bbox == pytest.approx([-97.0, 44.0, -91.0, 48.0])
+
+
+def test_scan_geojson_empty(empty_geojson):
+    bbox, nfeat = _scan_geojson(empty_geojson)
+    assert nfeat == 0
+    assert bbox is not None
+    assert all(math.isnan(v) for v in bbox)
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import Polygon
+
+from civic_data_boundaries_us_mn_precincts.validate import (
+    ValidateError,
+    _check_precinct_id_unique,
+    _load_gdf,
+)
+
+SQUARE = Polygon([(-94.0, 45.0), (-93.0, 45.0), (-93.0, 46.0), (-94.0, 46.0)])
+BOWTIE = Polygon([(-94.0, 45.0), (-93.0, 46.0), (-93.0, 45.0), (-94.0, 46.0)])
+
+
+def _write(tmp_path: Path, gdf: gpd.GeoDataFrame, name: str = "layer.geojson") -> Path:
+    path = tmp_path / name
+    gdf.to_file(path, driver="GeoJSON", engine="pyogrio")
+    return path
+
+
+def test_load_gdf_ok(tmp_path):
+    gdf = gpd.GeoDataFrame({"precinct_id": ["a"]}, geometry=[SQUARE], crs="EPSG:4326")
+    out = _load_gdf(_write(tmp_path, gdf))
+    assert len(out) == 1
+    assert list(out["precinct_id"]) == ["a"]
+
+
+def test_load_gdf_empty(tmp_path):
+    path = tmp_path / "empty.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": []}))
+    with pytest.raises(ValidateError, match="No features"):
+        _load_gdf(path)
+
+
+def test_load_gdf_unreadable(tmp_path):
+    path = tmp_path / "broken.geojson"
+    path.write_text("not json")
+    with pytest.raises(ValidateError, match="Failed to read"):
+        _load_gdf(path)
+
+
+def test_load_gdf_wrong_crs(tmp_path):
+    gdf = gpd.GeoDataFrame({"precinct_id": ["a"]}, geometry=[SQUARE], crs="EPSG:4326")
+    path = _write(tmp_path, gdf.to_crs("EPSG:3857"))
+    with pytest.raises(ValidateError, match="CRS must be EPSG:4326"):
+        _load_gdf(path)
+
+
+def test_load_gdf_invalid_geometry(tmp_path):
+    gdf = gpd.GeoDataFrame({"precinct_id": ["a", "b"]}, geometry=[SQUARE, BOWTIE], crs="EPSG:4326")
+    with pytest.raises(ValidateError, match="Found 1 invalid geometries"):
+        _load_gdf(_write(tmp_path, gdf))
+
+
+def test_check_precinct_id_unique_passes():
+    gdf = gpd.GeoDataFrame({"precinct_id": ["a", "b", "c"]}, geometry=[SQUARE] * 3)
+    _check_precinct_id_unique(gdf)
+
+
+def test_check_precinct_id_unique_missing_column_is_skipped():
+    gdf = gpd.GeoDataFrame({"county": ["x", "x"]}, geometry=[SQUARE] * 2)
+    _check_precinct_id_unique(gdf)
+
+
+def test_check_precinct_id_unique_reports_duplicates():
+    gdf = gpd.GeoDataFrame({"precinct_id": ["a", "b", "a", "c", "b"]}, geometry=[SQUARE] * 5)
+    with pytest.raises(ValidateError, match=r"Duplicate precinct_id values: \['a', 'b'\]"):
+        _check_precinct_id_unique(gdf)